@@ -5,7 +5,7 @@ a = Analysis(
     ['main.py'],
     pathex=[],
     binaries=[],
-    datas=[('icons/*', 'icons/'), ('welcome.html', '.')],
+    datas=[('icons/*', 'icons/'), ('welcome.html', '.'), ('geotrack_visualizer/utils/app.qss', '.')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
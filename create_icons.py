@@ -2,46 +2,76 @@
 """
 Convert SVG icon to PNG and ICO formats for application use.
 """
+import io
 import os
+import sys
 import cairosvg
 from PIL import Image
 
-# Create icons directory if it doesn't exist
-os.makedirs('icons', exist_ok=True)
+SVG_SOURCE = 'icons/app_icon.svg'
+SIZES = [16, 32, 48, 64, 128, 256]
+OUTPUTS = ['icons/app_icon.ico', 'icons/app_icon.png']
 
-# Convert SVG to PNG in various sizes
-sizes = [16, 32, 48, 64, 128, 256]
-png_files = []
 
-for size in sizes:
-    output_file = f'icons/app_icon_{size}.png'
-    cairosvg.svg2png(
-        url='icons/app_icon.svg',
-        write_to=output_file,
+def _up_to_date():
+    """Return True if every output exists and is newer than the SVG source."""
+    src_mtime = os.path.getmtime(SVG_SOURCE)
+    return all(os.path.exists(p) and os.path.getmtime(p) >= src_mtime for p in OUTPUTS)
+
+
+def _render(size, svg_bytes):
+    """Rasterize the SVG at the given size and return the PNG bytes."""
+    return cairosvg.svg2png(
+        bytestring=svg_bytes,
         output_width=size,
         output_height=size
     )
-    png_files.append(output_file)
-    print(f"Created {output_file}")
-
-# Create ICO file with multiple sizes
-ico_output = 'icons/app_icon.ico'
-images = [Image.open(png_file) for png_file in png_files]
-images[0].save(
-    ico_output,
-    format='ICO',
-    sizes=[(size, size) for size in sizes],
-    append_images=images[1:]
-)
-print(f"Created {ico_output}")
-
-# Create a 512x512 PNG for high-resolution displays
-cairosvg.svg2png(
-    url='icons/app_icon.svg',
-    write_to='icons/app_icon.png',
-    output_width=512,
-    output_height=512
-)
-print("Created icons/app_icon.png (512x512)")
-
-print("Icon conversion complete!")
+
+
+if __name__ == '__main__':
+    # Nothing to do if the SVG hasn't changed since the last build
+    if _up_to_date():
+        print("Icons are up to date.")
+        sys.exit(0)
+
+    # Create icons directory if it doesn't exist
+    os.makedirs('icons', exist_ok=True)
+
+    # Read the SVG once for both renders
+    with open(SVG_SOURCE, 'rb') as f:
+        svg_bytes = f.read()
+
+    # Only two vector renders are needed: a 256x256 base for the ICO sizes
+    # and a 512x512 PNG for high-resolution displays. They run serially; a
+    # process pool costs more to start than these two renders take.
+    base_png = _render(max(SIZES), svg_bytes)
+    hires_png = _render(512, svg_bytes)
+
+    with open('icons/app_icon.png', 'wb') as f:
+        f.write(hires_png)
+    print("Created icons/app_icon.png (512x512)")
+
+    # Derive the smaller sizes from the base raster instead of re-rendering the
+    # SVG; the images stay in memory and go straight into the ICO.
+    base = Image.open(io.BytesIO(base_png))
+    base.load()
+    images = [
+        base if size == base.width else base.resize((size, size), Image.LANCZOS)
+        for size in sorted(SIZES, reverse=True)
+    ]
+
+    # Create ICO file with multiple sizes; the largest image must come first
+    # because Pillow drops any requested size bigger than the primary image.
+    ico_output = 'icons/app_icon.ico'
+    # Pillow's ICO writer encodes each PNG frame with default settings (it does
+    # not forward compress_level/optimize), so only the format is pinned here.
+    images[0].save(
+        ico_output,
+        format='ICO',
+        sizes=[(size, size) for size in SIZES],
+        append_images=images[1:],
+        bitmap_format='png'
+    )
+    print(f"Created {ico_output}")
+
+    print("Icon conversion complete!")
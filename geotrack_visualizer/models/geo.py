@@ -1 +1,54 @@
-# Geospatial data loading and processing will be placed here
+# Geospatial data loading and processing
+import os
+import importlib.util
+
+def _find_sidecar(path):
+    """Return a binary copy of `path` (GeoParquet or FlatGeobuf) saved alongside it, if current."""
+    base, ext = os.path.splitext(path)
+    if ext.lower() not in ('.geojson', '.json'):
+        return None
+    try:
+        source_mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+    for sidecar_ext in ('.parquet', '.fgb'):
+        candidate = base + sidecar_ext
+        # Ignore stale copies so edits to the GeoJSON are never masked
+        if os.path.exists(candidate) and os.path.getmtime(candidate) >= source_mtime:
+            return candidate
+    return None
+
+def _repair_geometries(gdf):
+    """Fix invalid (e.g. self-intersecting) geometries in place with buffer(0)."""
+    invalid = ~gdf.is_valid
+    if invalid.any():
+        gdf.loc[invalid, 'geometry'] = gdf.loc[invalid, 'geometry'].buffer(0)
+    return gdf
+
+def read_features(path):
+    """Read a vector file into a GeoDataFrame.
+
+    A GeoParquet or FlatGeobuf file with the same name next to a GeoJSON is
+    read instead when it is at least as new, since both skip JSON parsing;
+    if that copy can't be read the GeoJSON is loaded as usual.
+    Uses the pyogrio engine (with Arrow when pyarrow is installed) for
+    vectorized reads, and falls back to geopandas' default engine when
+    pyogrio is not available. Invalid geometries are repaired on load.
+    """
+    import geopandas as gpd
+    use_arrow = importlib.util.find_spec('pyarrow') is not None
+    if importlib.util.find_spec('pyogrio') is not None:
+        engine_kwargs = {'engine': 'pyogrio', 'use_arrow': use_arrow}
+    else:
+        engine_kwargs = {}
+    sidecar = _find_sidecar(path)
+    if sidecar is not None and (use_arrow or not sidecar.endswith('.parquet')):
+        try:
+            if sidecar.endswith('.parquet'):
+                return _repair_geometries(gpd.read_parquet(sidecar))
+            return _repair_geometries(gpd.read_file(sidecar, **engine_kwargs))
+        except Exception:
+            # Not a usable copy (plain tabular parquet, corrupt file, ...);
+            # the GeoJSON itself is still authoritative
+            pass
+    return _repair_geometries(gpd.read_file(path, **engine_kwargs))
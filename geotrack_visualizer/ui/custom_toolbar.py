@@ -1,4 +1,5 @@
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT
+from PyQt5.QtWidgets import QToolButton
 
 class CustomNavigationToolbar(NavigationToolbar2QT):
     """
@@ -12,8 +13,11 @@ class CustomNavigationToolbar(NavigationToolbar2QT):
 
     def apply_tooltips_to_widgets(self):
         """Apply tooltips from QActions to their corresponding button widgets."""
-        for action in self.actions():
-            if action.toolTip():
-                widget = self.widgetForAction(action)
-                if widget:
+        # Walk the layout once; widgetForAction() would rescan it per action
+        layout = self.layout()
+        for i in range(layout.count()):
+            widget = layout.itemAt(i).widget()
+            if isinstance(widget, QToolButton):
+                action = widget.defaultAction()
+                if action and action.toolTip():
                     widget.setToolTip(action.toolTip())
@@ -1,4 +1,10 @@
-from PyQt5.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QFileDialog
+import os
+from PyQt5.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QFileDialog, QSizePolicy
+from PyQt5.QtCore import Qt, QSettings
+
+# Skip per-entry custom icon lookups and symlink resolution, which stall the
+# dialog on network and removable drives
+_DIALOG_OPTIONS = QFileDialog.DontUseCustomDirectoryIcons | QFileDialog.DontResolveSymlinks
 
 class FileSelectDialog(QDialog):
     """Dialog for selecting TIFF and GeoJSON files.
@@ -12,10 +18,17 @@ class FileSelectDialog(QDialog):
         self.tiff_path = ''
         self.geojson_path = ''
         self.default_dir = default_dir
+        # Each picker reopens in the folder it was last used in
+        self.settings = QSettings('GeoTrack', 'Visualizer')
         self.init_ui()
 
     def init_ui(self):
         layout = QVBoxLayout(self)
+        # One dialog for both files when they sit in the same folder; the
+        # per-file buttons below stay for replacing just one of them
+        self.both_button = QPushButton('Browse Both Files...')
+        self.both_button.clicked.connect(self.select_both)
+        layout.addWidget(self.both_button)
         file_layout = QHBoxLayout()
         self.tiff_label = QLabel('TIFF File:')
         self.tiff_button = QPushButton('Browse')
@@ -30,6 +43,11 @@ class FileSelectDialog(QDialog):
         geo_layout.addWidget(self.geojson_label)
         geo_layout.addWidget(self.geojson_button)
         layout.addLayout(geo_layout)
+        # Path labels take whatever width the row gives them, so a long path
+        # is elided instead of resizing the dialog
+        for label in (self.tiff_label, self.geojson_label):
+            label.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Preferred)
+            label.setMinimumWidth(120)
         button_layout = QHBoxLayout()
         self.ok_button = QPushButton('OK')
         self.ok_button.clicked.connect(self.accept)
@@ -39,14 +57,49 @@ class FileSelectDialog(QDialog):
         button_layout.addWidget(self.cancel_button)
         layout.addLayout(button_layout)
 
+    def last_dir(self, key):
+        """Get the remembered directory for a picker, falling back to the default"""
+        path = self.settings.value(key, '', type=str)
+        return path if path and os.path.isdir(path) else self.default_dir
+
     def select_tiff(self):
-        file, _ = QFileDialog.getOpenFileName(self, 'Select TIFF File', self.default_dir, 'TIFF Files (*.tif *.tiff)')
+        file, _ = QFileDialog.getOpenFileName(self, 'Select TIFF File', self.last_dir('last_tiff_dir'), 'TIFF Files (*.tif *.tiff)', options=_DIALOG_OPTIONS)
         if file:
+            self.settings.setValue('last_tiff_dir', os.path.dirname(file))
             self.tiff_path = file
-            self.tiff_label.setText(f'TIFF File: {file}')
+            self.update_path_labels()
 
     def select_geojson(self):
-        file, _ = QFileDialog.getOpenFileName(self, 'Select GeoJSON File', self.default_dir, 'GeoJSON Files (*.geojson *.json)')
+        file, _ = QFileDialog.getOpenFileName(self, 'Select GeoJSON File', self.last_dir('last_geojson_dir'), 'GeoJSON Files (*.geojson *.json)', options=_DIALOG_OPTIONS)
         if file:
+            self.settings.setValue('last_geojson_dir', os.path.dirname(file))
             self.geojson_path = file
-            self.geojson_label.setText(f'GeoJSON File: {file}')
+            self.update_path_labels()
+
+    def select_both(self):
+        files, _ = QFileDialog.getOpenFileNames(self, 'Select TIFF and GeoJSON Files', self.last_dir('last_geojson_dir'),
+                                                'Data Files (*.tif *.tiff *.geojson *.json)', options=_DIALOG_OPTIONS)
+        tiff = next((f for f in files if f.lower().endswith(('.tif', '.tiff'))), None)
+        geojson = next((f for f in files if f.lower().endswith(('.geojson', '.json'))), None)
+        if tiff:
+            self.settings.setValue('last_tiff_dir', os.path.dirname(tiff))
+            self.tiff_path = tiff
+        if geojson:
+            self.settings.setValue('last_geojson_dir', os.path.dirname(geojson))
+            self.geojson_path = geojson
+        if tiff or geojson:
+            self.update_path_labels()
+
+    def update_path_labels(self):
+        """Show the selected paths, elided in the middle to fit their labels"""
+        for label, prefix, path in ((self.tiff_label, 'TIFF File:', self.tiff_path),
+                                    (self.geojson_label, 'GeoJSON File:', self.geojson_path)):
+            if not path:
+                continue
+            text = f'{prefix} {path}'
+            label.setText(label.fontMetrics().elidedText(text, Qt.ElideMiddle, label.width()))
+            label.setToolTip(path)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.update_path_labels()
@@ -1,39 +1,109 @@
 # MainWindow class will be placed here
 
 import os
+import json
+import threading
+import functools
+import importlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QPushButton, QLabel, QFileDialog, QTableWidget, 
     QTableWidgetItem, QHBoxLayout, QMessageBox, QDialog, QCheckBox, QComboBox, QSplitter,
-    QHeaderView, QTextBrowser, QFrame
+    QHeaderView, QTextBrowser, QFrame, QAction, QStyle
 )
-from PyQt5.QtCore import Qt, QSize
+from PyQt5.QtCore import Qt, QSize, QTimer, QSettings
 from PyQt5.QtGui import QPalette, QColor, QFont, QIcon
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.figure import Figure
 from .custom_toolbar import CustomNavigationToolbar
-from ..utils.helpers import resource_path
+from ..models.geo import read_features
+from ..utils.helpers import resource_path, app_stylesheet, app_icon
 
 # Project root icons directory
 ICONS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../icons'))
 
+# Longest raster side (in pixels) read from a TIFF; larger rasters are
+# downsampled at read time. Leaves headroom for zooming in past screen size.
+MAX_RASTER_SIZE = 2000
+
+# Modules pulled in by the first map load, imported in the background at startup
+_WARM_MODULES = (
+    'pandas.api.types', 'geopandas', 'pyogrio', 'pyarrow', 'rasterio', 'rasterio.enums',
+    'matplotlib.ticker',
+)
+
+# Upper bound on bearing arrows drawn per track; longer tracks are strided
+MAX_QUIVER_ARROWS = 5000
+
+# Theme rules for the top controls, keyed on object names. They are appended
+# to the base app.qss so a theme switch is a single setStyleSheet call on the
+# QApplication.
+_LIGHT_QSS = """
+QLabel#sectionLabel, QLabel#mapStyleLabel { color: black; font-weight: bold; }
+QPushButton#liveButton { padding: 4px 8px; font-weight: bold; color: #777777; background-color: #e0e0e0; }
+QPushButton#histButton { padding: 4px 8px; font-weight: bold; color: black; background-color: #4CAF50; }
+QCheckBox#darkModeCheckbox, QCheckBox#welcomeCheckbox { color: black; }
+QComboBox#mapStyleCombo { background-color: white; color: black; selection-background-color: #e0e0e0; }
+"""
+_DARK_QSS = """
+QLabel#sectionLabel, QLabel#mapStyleLabel { color: white; font-weight: bold; }
+QPushButton#liveButton { padding: 4px 8px; font-weight: bold; color: #aaaaaa; background-color: #555555; }
+QPushButton#histButton { padding: 4px 8px; font-weight: bold; color: white; background-color: #4CAF50; }
+QCheckBox#darkModeCheckbox, QCheckBox#welcomeCheckbox { color: white; }
+QComboBox#mapStyleCombo { background-color: #444444; color: white; selection-background-color: #666666; }
+QToolTip { color: #ffffff; background-color: #2a82da; border: 1px solid white; }
+"""
+
+@functools.lru_cache(maxsize=None)
+def _icon(path):
+    """Return a QIcon for the given file, loading each file only once per process."""
+    return QIcon(path)
+
+@functools.lru_cache(maxsize=None)
+def _standard_icon(standard_pixmap):
+    """Return a cached icon from the application style."""
+    return QApplication.style().standardIcon(standard_pixmap)
+
 class MainWindow(QMainWindow):
     """Main application window for the GeoTrack Visualizer.
     
     This class handles the main UI setup, file loading, map rendering,
     and interactive features of the application.
     """
+    # Parsed config.json, shared by all windows once read or written
+    _config_cache = None
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle('GeoTrack Visualizer')
         self.resize(1200, 800)
         
         # Set application icon
-        app_icon = QIcon(os.path.join(ICONS_DIR, 'app_icon.png'))
-        self.setWindowIcon(app_icon)
+        self.setWindowIcon(app_icon())
         
+        # Import the heavy map dependencies while the user is still picking files
+        # Keep the handle so the load path can wait for it to finish
+        self._warm_thread = threading.Thread(target=self._warm_imports, daemon=True)
+        self._warm_thread.start()
+
         self.default_dir = self.load_or_select_default_directory()
         self.dark_mode = False
         self.init_ui()
 
+    def _warm_imports(self):
+        """Pre-import the modules used by show_map_and_table into sys.modules."""
+        # show_map_and_table joins this thread before importing anything heavy
+        for name in _WARM_MODULES:
+            try:
+                importlib.import_module(name)
+            except ImportError:
+                # Surface the error where the modules are actually needed;
+                # pyogrio and pyarrow are optional anyway
+                pass
+
     def load_or_select_default_directory(self):
         """Load the default directory from config or prompt user to select one.
         
@@ -42,29 +112,28 @@ class MainWindow(QMainWindow):
         """
         # Try to load from config file
         from ..utils.helpers import CONFIG_PATH
-        from ..utils.helpers import SETTINGS_DIR
-        import os
-        import json
-        if os.path.exists(CONFIG_PATH):
+        if MainWindow._config_cache is None and os.path.isfile(CONFIG_PATH):
             try:
-                with open(CONFIG_PATH, 'r') as f:
-                    config = json.load(f)
-                    return config.get('default_directory', '')
-            except (json.JSONDecodeError, IOError):
+                with open(CONFIG_PATH, 'rb') as f:
+                    data = f.read()
+                MainWindow._config_cache = orjson.loads(data) if orjson is not None else json.loads(data)
+            except (ValueError, IOError):
                 pass
+        if MainWindow._config_cache is not None:
+            return MainWindow._config_cache.get('default_directory', '')
         return self.select_and_save_directory()
 
     def select_and_save_directory(self):
         """Prompt user to select a default directory and save it to config."""
         from ..utils.helpers import CONFIG_PATH
         from ..utils.helpers import SETTINGS_DIR
-        import os
-        import json
         directory = QFileDialog.getExistingDirectory(self, "Select Default Directory")
         if directory:
             os.makedirs(SETTINGS_DIR, exist_ok=True)
+            config = {'default_directory': directory}
             with open(CONFIG_PATH, 'w') as f:
-                json.dump({'default_directory': directory}, f)
+                json.dump(config, f)
+            MainWindow._config_cache = config
             return directory
         return ''
 
@@ -86,7 +155,6 @@ class MainWindow(QMainWindow):
         # Create mode label with adaptive styling
         self.mode_label = QLabel("Mode:")
         self.mode_label.setObjectName("sectionLabel")
-        self.mode_label.setStyleSheet("font-weight: bold;")
         mode_layout.addWidget(self.mode_label)
         
         # Live tracking button (disabled)
@@ -94,14 +162,12 @@ class MainWindow(QMainWindow):
         self.live_btn.setEnabled(False)
         self.live_btn.setToolTip('Live tracking functionality is currently disabled in this version')
         self.live_btn.setObjectName("liveButton")
-        self.live_btn.setStyleSheet("padding: 4px 8px; font-weight: bold;")
         
         # Historical tracking button (active)
         self.hist_btn = QPushButton('Historical Tracking')
         self.hist_btn.setToolTip('Load historical tracking data from TIFF and GeoJSON files')
         self.hist_btn.clicked.connect(self.start_historical_tracking)
         self.hist_btn.setObjectName("histButton")
-        self.hist_btn.setStyleSheet("padding: 4px 8px; font-weight: bold; background-color: #4CAF50;")
         
         mode_layout.addWidget(self.live_btn)
         mode_layout.addWidget(self.hist_btn)
@@ -114,7 +180,6 @@ class MainWindow(QMainWindow):
         # Create settings label with adaptive styling
         self.settings_label = QLabel("Settings:")
         self.settings_label.setObjectName("sectionLabel")
-        self.settings_label.setStyleSheet("font-weight: bold;")
         settings_layout.addWidget(self.settings_label)
         
         # Dark mode toggle
@@ -123,12 +188,21 @@ class MainWindow(QMainWindow):
         self.dark_mode_cb.stateChanged.connect(self.toggle_dark_mode)
         settings_layout.addWidget(self.dark_mode_cb)
         
+        # Undo "Don't show this again" from the welcome screen
+        self.welcome_cb = QCheckBox("Show Welcome Screen")
+        self.welcome_cb.setObjectName("welcomeCheckbox")
+        self.welcome_cb.setToolTip('Show the welcome screen when the application starts')
+        self.welcome_cb.setChecked(not QSettings('GeoTrack', 'Visualizer').value('skip_welcome', False, type=bool))
+        self.welcome_cb.stateChanged.connect(self.toggle_welcome_screen)
+        settings_layout.addWidget(self.welcome_cb)
+        
         # Map style selector
         self.map_style_label = QLabel("Map Style:")
         self.map_style_label.setObjectName("mapStyleLabel")
         settings_layout.addWidget(self.map_style_label)
         
         self.map_style = QComboBox()
+        self.map_style.setObjectName("mapStyleCombo")
         self.map_style.addItems(["Default", "Terrain", "Satellite"])
         self.map_style.currentIndexChanged.connect(self.update_map_style)
         settings_layout.addWidget(self.map_style)
@@ -143,29 +217,104 @@ class MainWindow(QMainWindow):
         
         self.central_widget.layout().addLayout(top_controls)
 
+        # Map canvas, toolbar and attribute table are created once and reused
+        # for every load; they stay hidden until the first map is shown.
+        self.figure = Figure(figsize=(6, 6))
+        self.ax = self.figure.add_subplot(111)
+        self.canvas = FigureCanvas(self.figure)
+        self.toolbar = self.create_map_toolbar()
+        self.table = QTableWidget()
+        self.table.setAlternatingRowColors(True)
+        self.table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.table.setSelectionMode(QTableWidget.SingleSelection)
+        self.table.setStyleSheet(
+            "QTableWidget {gridline-color: #d0d0d0; border: 1px solid #c0c0c0;}"
+            "QHeaderView::section {background-color: #f0f0f0; padding: 4px; border: 1px solid #c0c0c0;}"
+            "QTableWidget::item:selected {background-color: #308cc6; color: white;}"
+        )
+        self.splitter = QSplitter(Qt.Horizontal)
+        self.splitter.addWidget(self.canvas)
+        self.splitter.addWidget(self.table)
+        self.splitter.setSizes([600, 400])
+        self.central_widget.layout().addWidget(self.toolbar)
+        self.central_widget.layout().addWidget(self.splitter)
+        self.toolbar.hide()
+        self.splitter.hide()
+        self._map_cids = []
+
+    def create_map_toolbar(self):
+        """Build the navigation toolbar for the map canvas with the app's own actions."""
+        toolbar = CustomNavigationToolbar(self.canvas, self)
+        clear_icon = _standard_icon(QStyle.SP_DialogResetButton)
+        zoom_in_icon = _icon(os.path.join(ICONS_DIR, 'plus.svg'))
+        zoom_out_icon = _icon(os.path.join(ICONS_DIR, 'minus.svg'))
+        zoom_in_action = QAction(zoom_in_icon, '', self)
+        zoom_in_action.setToolTip('Zoom In: Make the map view larger. Click to zoom in and see more detail in the current region.')
+        zoom_out_action = QAction(zoom_out_icon, '', self)
+        zoom_out_action.setToolTip('Zoom Out: Make the map view smaller. Click to zoom out and see a larger area of the map.')
+        clear_action = QAction(clear_icon, '', self)
+        clear_action.setToolTip('Clear: Remove all map overlays and uploaded data. Use this to reset the workspace and upload new files.')
+        pan_cursor_path = os.path.join(ICONS_DIR, 'pan_cursor.png')
+        if os.path.isfile(pan_cursor_path):
+            pan_icon = _icon(pan_cursor_path)
+        else:
+            pan_icon = _icon(os.path.join(ICONS_DIR, 'pan.svg'))
+        reset_icon = _icon(os.path.join(ICONS_DIR, 'reset.svg'))
+        # Classify the default matplotlib actions by role in a single pass
+        roles = {}
+        for act in toolbar.actions():
+            tip = act.toolTip().lower()
+            if 'home' in tip or 'reset original view' in tip:
+                roles['home'] = act
+            elif 'pan' in tip:
+                roles['pan'] = act
+            elif 'zoom' in tip and 'rect' in tip:
+                roles['zoom_rect'] = act
+            elif 'save' in tip:
+                roles['save'] = act
+        home_action = roles.get('home')
+        if home_action:
+            home_action.setIcon(reset_icon)
+            home_action.setToolTip('Reset View: Return the map to its original extent and zoom level. Use this if you want to quickly see the entire map as it was loaded.')
+        pan_action = roles.get('pan')
+        if pan_action:
+            pan_action.setIcon(pan_icon)
+            pan_action.setToolTip('Pan Map: Click and drag the map to move to different areas.\nLeft-click: Move the map.\nRight-click: Move the map and zoom at the same time. Useful for exploring regions outside the current view.')
+        reset_zoom_action = roles.get('zoom_rect')
+        if reset_zoom_action:
+            reset_zoom_action.setToolTip('Reset Zoom: Fit the map to the window. Use this to automatically adjust the map to fit all data layers in view.')
+        if 'save' in roles:
+            roles['save'].setToolTip('Save Map as Image: Save the current map view as a PNG file.')
+        # Move our actions to the front of the toolbar in display order
+        leading = [act for act in (home_action, pan_action, zoom_in_action, zoom_out_action,
+                                   reset_zoom_action, clear_action) if act is not None]
+        for act in leading:
+            toolbar.removeAction(act)
+        remaining = toolbar.actions()
+        toolbar.insertActions(remaining[0] if remaining else None, leading)
+        zoom_in_action.triggered.connect(lambda: self.zoom_map(0.5))
+        zoom_out_action.triggered.connect(lambda: self.zoom_map(2.0))
+        clear_action.triggered.connect(self.clear_all)
+        return toolbar
+
+    def zoom_map(self, factor):
+        """Scale the current map view around its center by the given factor."""
+        cur_xlim = self.ax.get_xlim()
+        cur_ylim = self.ax.get_ylim()
+        x_c = (cur_xlim[0] + cur_xlim[1]) / 2
+        y_c = (cur_ylim[0] + cur_ylim[1]) / 2
+        x_range = (cur_xlim[1] - cur_xlim[0]) * factor / 2
+        y_range = (cur_ylim[1] - cur_ylim[0]) * factor / 2
+        self.ax.set_xlim([x_c - x_range, x_c + x_range])
+        self.ax.set_ylim([y_c - y_range, y_c + y_range])
+        self.canvas.draw()
+
     def update_ui_colors(self, dark_mode):
         """Update UI element colors based on dark/light mode for optimal readability."""
-        if dark_mode:
-            label_color = "color: white; font-weight: bold;"
-            button_text_color = "color: white;"
-            disabled_button_color = "color: #aaaaaa; background-color: #555555;"
-            active_button_color = "color: white; background-color: #4CAF50;"
-            checkbox_style = "color: white;"
-            combobox_style = "background-color: #444444; color: white; selection-background-color: #666666;"
-        else:
-            label_color = "color: black; font-weight: bold;"
-            button_text_color = "color: black;"
-            disabled_button_color = "color: #777777; background-color: #e0e0e0;"
-            active_button_color = "color: black; background-color: #4CAF50;"
-            checkbox_style = "color: black;"
-            combobox_style = "background-color: white; color: black; selection-background-color: #e0e0e0;"
-        for label in self.findChildren(QLabel, "sectionLabel"):
-            label.setStyleSheet(label_color)
-        self.map_style_label.setStyleSheet(label_color)
-        self.live_btn.setStyleSheet(f"padding: 4px 8px; font-weight: bold; {disabled_button_color}")
-        self.hist_btn.setStyleSheet(f"padding: 4px 8px; font-weight: bold; {active_button_color}")
-        self.dark_mode_cb.setStyleSheet(checkbox_style)
-        self.map_style.setStyleSheet(combobox_style)
+        QApplication.instance().setStyleSheet(app_stylesheet() + (_DARK_QSS if dark_mode else _LIGHT_QSS))
+
+    def toggle_welcome_screen(self, state):
+        QSettings('GeoTrack', 'Visualizer').setValue('skip_welcome', state != Qt.Checked)
 
     def toggle_dark_mode(self, state):
         self.dark_mode = state == Qt.Checked
@@ -186,31 +335,26 @@ class MainWindow(QMainWindow):
             dark_palette.setColor(QPalette.Highlight, QColor(42, 130, 218))
             dark_palette.setColor(QPalette.HighlightedText, Qt.black)
             app.setPalette(dark_palette)
-            app.setStyleSheet("QToolTip { color: #ffffff; background-color: #2a82da; border: 1px solid white; }")
         else:
             app.setPalette(app.style().standardPalette())
-            app.setStyleSheet("")
         self.update_ui_colors(self.dark_mode)
 
     def update_map_style(self, index):
+        if getattr(self, 'canvas', None) is None:
+            return
         style = self.map_style.currentText()
-        for widget in self.findChildren(QWidget):
-            if hasattr(widget, 'figure') and hasattr(widget, 'draw'):
-                fig = widget.figure
-                if fig and len(fig.axes) > 0:
-                    ax = fig.axes[0]
-                    for img in ax.get_images():
-                        if len(img.get_array().shape) == 2:  
-                            if style == "Terrain":
-                                img.set_cmap('terrain')
-                                img.set_alpha(0.8)
-                            elif style == "Satellite":
-                                img.set_cmap('gist_earth')
-                                img.set_alpha(1.0)
-                            else:
-                                img.set_cmap('gray')
-                                img.set_alpha(0.5)
-                    widget.draw()
+        for img in self.ax.get_images():
+            if len(img.get_array().shape) == 2:  
+                if style == "Terrain":
+                    img.set_cmap('terrain')
+                    img.set_alpha(0.8)
+                elif style == "Satellite":
+                    img.set_cmap('gist_earth')
+                    img.set_alpha(1.0)
+                else:
+                    img.set_cmap('gray')
+                    img.set_alpha(0.5)
+        self.canvas.draw()
 
     def start_historical_tracking(self):
         from .file_select_dialog import FileSelectDialog
@@ -219,12 +363,14 @@ class MainWindow(QMainWindow):
             self.show_map_and_table(dialog.tiff_path, dialog.geojson_path)
 
     def show_map_and_table(self, tiff_path, geojson_path):
-        import geopandas as gpd
+        # Finish the background imports first: importing the same packages from
+        # two threads can hand this one a partially initialized module
+        self._warm_thread.join()
         import rasterio
-        import matplotlib.pyplot as plt
+        from rasterio.enums import Resampling
         import numpy as np
-        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-        from PyQt5.QtWidgets import QSplitter, QMessageBox, QHBoxLayout, QPushButton, QProgressDialog
+        from pandas.api.types import is_numeric_dtype, is_bool_dtype
+        from PyQt5.QtWidgets import QProgressDialog
         progress = QProgressDialog('Loading map and data...', None, 0, 0, self)
         progress.setWindowTitle('GeoTrack Visualizer')
         progress.setWindowModality(Qt.WindowModal)
@@ -232,51 +378,79 @@ class MainWindow(QMainWindow):
         progress.show()
         QApplication.processEvents()
         self.setWindowTitle('GeoTrack Visualizer')
-        for i in reversed(range(self.central_widget.layout().count())):
-            widget = self.central_widget.layout().itemAt(i).widget()
-            if widget:
-                widget.setParent(None)
-        splitter = QSplitter(Qt.Horizontal)
-        self.central_widget.layout().addWidget(splitter)
-        fig, ax = plt.subplots(figsize=(6, 6))
+        self.reset_map_view()
+        fig, ax, canvas, table = self.figure, self.ax, self.canvas, self.table
         try:
             with rasterio.open(tiff_path) as src:
                 extent = [src.bounds.left, src.bounds.right, src.bounds.bottom, src.bounds.top]
                 tiff_crs = src.crs
+                # Cap the read resolution; anything much finer than the screen
+                # is resampled away by matplotlib on every draw. The extent
+                # comes from the bounds, so georeferencing is unaffected.
+                # For tiled TIFFs with overviews (COGs) GDAL serves decimated
+                # reads from the closest overview level rather than full res.
+                target = max(MAX_RASTER_SIZE, int(fig.get_dpi() * max(fig.get_size_inches())))
+                scale = min(1.0, target / max(src.height, src.width))
+                out_height = max(1, int(round(src.height * scale)))
+                out_width = max(1, int(round(src.width * scale)))
                 if src.count == 3:
-                    r = src.read(1)
-                    g = src.read(2)
-                    b = src.read(3)
-                    rgb = np.dstack((r, g, b))
-                    if rgb.max() > 255:
-                        rgb = rgb / rgb.max()
+                    # One read for all bands, viewed as HxWx3 for imshow
+                    rgb = np.transpose(
+                        src.read(out_shape=(src.count, out_height, out_width), resampling=Resampling.average),
+                        (1, 2, 0)
+                    )
+                    if rgb.dtype != np.uint8:
+                        rgb_max = rgb.max()
+                        if rgb_max > 255:
+                            rgb = rgb.astype(np.float32)
+                            rgb /= rgb_max
                     ax.imshow(rgb, extent=extent, origin='upper', aspect='auto')
                 else:
-                    raster = src.read(1)
+                    raster = src.read(1, out_shape=(out_height, out_width), resampling=Resampling.average)
                     ax.imshow(raster, extent=extent, cmap='gray', alpha=0.5, origin='upper', aspect='auto')
         except Exception as e:
             ax.text(0.5, 0.5, f'Failed to load TIFF:\n{e}', ha='center', va='center')
             tiff_crs = None
         try:
-            gdf = gpd.read_file(geojson_path)
+            gdf = read_features(geojson_path)
             if gdf.crs is None:
                 gdf = gdf.set_crs('EPSG:4326', allow_override=True)
             need_reproject = tiff_crs is not None and gdf.crs != tiff_crs
-            orig_points = np.array([(geom.x, geom.y) for geom in gdf.geometry])
-            gdf_orig = gdf.copy()
+            # Source coordinates are needed for the table either way; to_crs
+            # returns a new frame, so the original needs no defensive copy
+            orig_points = np.column_stack([gdf.geometry.x.to_numpy(), gdf.geometry.y.to_numpy()])
+            gdf_orig = gdf
             if need_reproject:
                 gdf = gdf.to_crs(tiff_crs)
-                points = np.array([(geom.x, geom.y) for geom in gdf.geometry])
+                points = np.column_stack([gdf.geometry.x.to_numpy(), gdf.geometry.y.to_numpy()])
             else:
                 points = orig_points
             scatter = ax.scatter(points[:, 0], points[:, 1], color='red', s=40, alpha=0.7, picker=True)
+            # RGBA face colors, copied and patched on each pick
+            base_colors = np.tile(np.array([[1.0, 0.0, 0.0, 0.7]]), (len(points), 1))
+            scatter.set_facecolors(base_colors)
             if 'TN Bearing' in gdf.columns:
-                bearings = gdf['TN Bearing'].values
+                # Force a float64 array (nullable/object columns included) and
+                # mask missing bearings so quiver skips them instead of warning
+                bearings = np.ma.masked_invalid(gdf['TN Bearing'].to_numpy(dtype=np.float64, na_value=np.nan))
                 angles = np.deg2rad(bearings)
-                arrow_length = 0.0005 * max(ax.get_xlim()[1] - ax.get_xlim()[0], ax.get_ylim()[1] - ax.get_ylim()[0])
+                # Size arrows against the final view (the raster extent) rather
+                # than the provisional autoscaled limits
+                if 'extent' in locals():
+                    span = max(extent[1] - extent[0], extent[3] - extent[2])
+                else:
+                    xlim = ax.get_xlim()
+                    ylim = ax.get_ylim()
+                    span = max(xlim[1] - xlim[0], ylim[1] - ylim[0])
+                arrow_length = 0.0005 * span
+                # Thin out arrows on long tracks; past a few thousand they
+                # overlap into a solid line and dominate the draw time
+                step = max(1, -(-len(points) // MAX_QUIVER_ARROWS))
+                arrow_points = points[::step]
+                angles = angles[::step]
                 dx = arrow_length * np.sin(angles)
                 dy = arrow_length * np.cos(angles)
-                ax.quiver(points[:, 0], points[:, 1], dx, dy, angles='xy', scale_units='xy', scale=1, color='blue', width=0.003, headwidth=3)
+                ax.quiver(arrow_points[:, 0], arrow_points[:, 1], dx, dy, angles='xy', scale_units='xy', scale=1, color='blue', width=0.003, headwidth=3)
         except Exception as e:
             ax.text(0.5, 0.3, f'Failed to load GeoJSON:\n{e}', ha='center', va='center')
             gdf = None
@@ -294,189 +468,152 @@ class MainWindow(QMainWindow):
         if 'extent' in locals():
             ax.set_xlim(extent[0], extent[1])
             ax.set_ylim(extent[2], extent[3])
-        canvas = FigureCanvas(fig)
-        splitter.addWidget(canvas)
-        def zoom(factor):
-            cur_xlim = ax.get_xlim()
-            cur_ylim = ax.get_ylim()
-            x_c = (cur_xlim[0] + cur_xlim[1]) / 2
-            y_c = (cur_ylim[0] + cur_ylim[1]) / 2
-            x_range = (cur_xlim[1] - cur_xlim[0]) * factor / 2
-            y_range = (cur_ylim[1] - cur_ylim[0]) * factor / 2
-            ax.set_xlim([x_c - x_range, x_c + x_range])
-            ax.set_ylim([y_c - y_range, y_c + y_range])
-            canvas.draw()
-        from PyQt5.QtWidgets import QAction
-        from PyQt5.QtGui import QIcon
-        from PyQt5.QtCore import QSize
-        from PyQt5.QtWidgets import QStyle
-        toolbar = CustomNavigationToolbar(canvas, self)
-        style = QApplication.style()
-        clear_icon = style.standardIcon(QStyle.SP_DialogResetButton)
-        zoom_in_icon = QIcon(os.path.join(ICONS_DIR, 'plus.svg'))
-        zoom_out_icon = QIcon(os.path.join(ICONS_DIR, 'minus.svg'))
-        zoom_in_action = QAction(zoom_in_icon, '', self)
-        zoom_in_action.setToolTip('Zoom In: Make the map view larger')
-        zoom_out_action = QAction(zoom_out_icon, '', self)
-        zoom_out_action.setToolTip('Zoom Out: Make the map view smaller')
-        clear_action = QAction(clear_icon, '', self)
-        clear_action.setToolTip('Clear: Remove current map and table, and upload new files')
-        for action in [zoom_in_action, zoom_out_action, clear_action]:
-            toolbar.removeAction(action)
-        default_actions = toolbar.actions()
-        home_action = None
-        pan_action = None
-        pan_cursor_path = os.path.join(ICONS_DIR, 'pan_cursor.png')
-        if os.path.isfile(pan_cursor_path):
-            pan_icon = QIcon(pan_cursor_path)
-        else:
-            pan_icon = QIcon(os.path.join(ICONS_DIR, 'pan.svg'))
-        reset_icon = QIcon(os.path.join(ICONS_DIR, 'reset.svg'))
-        for act in default_actions:
-            tip = act.toolTip().lower()
-            if 'home' in tip or 'reset original view' in tip:
-                home_action = act
-                act.setIcon(reset_icon)
-                act.setToolTip('Reset View: Return the map to its original extent and zoom level. Use this if you want to quickly see the entire map as it was loaded.')
-            elif 'pan' in tip:
-                pan_action = act
-                act.setIcon(pan_icon)
-                act.setToolTip('Pan Map: Click and drag the map to move to different areas.\nLeft-click: Move the map.\nRight-click: Move the map and zoom at the same time. Useful for exploring regions outside the current view.')
-            elif 'zoom' in tip and 'rect' in tip:
-                act.setToolTip('Zoom to Rectangle: Drag to select a region to zoom into for a closer view.')
-            elif 'save' in tip:
-                act.setToolTip('Save Map as Image: Save the current map view as a PNG file.')
-        insert_index = 0
-        if home_action:
-            toolbar.removeAction(home_action)
-            toolbar.insertAction(toolbar.actions()[insert_index], home_action)
-            insert_index += 1
-        if pan_action:
-            toolbar.removeAction(pan_action)
-            toolbar.insertAction(toolbar.actions()[insert_index], pan_action)
-            insert_index += 1
-        toolbar.insertAction(toolbar.actions()[insert_index], zoom_in_action)
-        zoom_in_action.setToolTip('Zoom In: Make the map view larger. Click to zoom in and see more detail in the current region.')
-        insert_index += 1
-        toolbar.insertAction(toolbar.actions()[insert_index], zoom_out_action)
-        zoom_out_action.setToolTip('Zoom Out: Make the map view smaller. Click to zoom out and see a larger area of the map.')
-        insert_index += 1
-        reset_zoom_action = None
-        for act in toolbar.actions():
-            if 'zoom' in act.toolTip().lower() and 'rect' in act.toolTip().lower():
-                reset_zoom_action = act
-                break
-        if reset_zoom_action:
-            toolbar.removeAction(reset_zoom_action)
-            toolbar.insertAction(toolbar.actions()[insert_index], reset_zoom_action)
-            reset_zoom_action.setToolTip('Reset Zoom: Fit the map to the window. Use this to automatically adjust the map to fit all data layers in view.')
-            insert_index += 1
-        toolbar.insertAction(toolbar.actions()[insert_index], clear_action)
-        clear_action.setToolTip('Clear: Remove all map overlays and uploaded data. Use this to reset the workspace and upload new files.')
-        def zoom(factor):
-            cur_xlim = ax.get_xlim()
-            cur_ylim = ax.get_ylim()
-            x_c = (cur_xlim[0] + cur_xlim[1]) / 2
-            y_c = (cur_ylim[0] + cur_ylim[1]) / 2
-            x_range = (cur_xlim[1] - cur_xlim[0]) * factor / 2
-            y_range = (cur_ylim[1] - cur_ylim[0]) * factor / 2
-            ax.set_xlim([x_c - x_range, x_c + x_range])
-            ax.set_ylim([y_c - y_range, y_c + y_range])
-            canvas.draw()
-        zoom_in_action.triggered.connect(lambda: zoom(0.5))
-        zoom_out_action.triggered.connect(lambda: zoom(2.0))
-        clear_action.triggered.connect(self.clear_all)
-        self.central_widget.layout().insertWidget(1, toolbar)
-        toolbar.setEnabled(True)
-        toolbar.setVisible(True)
+        # Home should return to the freshly loaded view, not the previous map's
+        self.toolbar.update()
+        self.toolbar.show()
+        self.splitter.show()
         self.activateWindow()
-        table = QTableWidget()
-        table.setAlternatingRowColors(True)
-        table.setSelectionBehavior(QTableWidget.SelectRows)
-        table.setSelectionMode(QTableWidget.SingleSelection)
-        table.setStyleSheet(
-            "QTableWidget {gridline-color: #d0d0d0; border: 1px solid #c0c0c0;}"
-            "QHeaderView::section {background-color: #f0f0f0; padding: 4px; border: 1px solid #c0c0c0;}"
-            "QTableWidget::item:selected {background-color: #308cc6; color: white;}"
-        )
         if gdf is not None:
-            import json
-            with open(geojson_path, 'r') as f:
-                data = json.load(f)
-            orig_lons = []
-            orig_lats = []
-            for feature in data['features']:
-                coords = feature['geometry']['coordinates']
-                orig_lons.append(coords[0])
-                orig_lats.append(coords[1])
-            props = gdf_orig.drop(columns='geometry').copy()
-            props['Longitude'] = orig_lons
-            props['Latitude'] = orig_lats
+            props = gdf_orig.drop(columns='geometry')
+            props['Longitude'] = orig_points[:, 0]
+            props['Latitude'] = orig_points[:, 1]
             if 'need_reproject' in locals() and need_reproject:
-                props['Mapped Longitude'] = gdf.geometry.x
-                props['Mapped Latitude'] = gdf.geometry.y
+                props['Mapped Longitude'] = points[:, 0]
+                props['Mapped Latitude'] = points[:, 1]
                 columns = list(props.columns)
             else:
                 columns = list(props.columns)
                 columns = [c for c in columns if c not in ['Mapped Longitude', 'Mapped Latitude']]
+            # Format each column up front so the fill loop only creates items
+            latlon_cols = {'Longitude', 'Latitude', 'Mapped Longitude', 'Mapped Latitude'}
+            # pandas' own checks also handle extension dtypes (nullable Int64,
+            # Arrow strings, categoricals); bools stay left-aligned as before
+            numeric_cols = {c for c in columns
+                            if is_numeric_dtype(props[c]) and not is_bool_dtype(props[c])}
+            numeric_align = Qt.AlignRight | Qt.AlignVCenter
+            col_specs = []
+            for col in columns:
+                if col in latlon_cols:
+                    strings = np.char.mod('%.15f', props[col].to_numpy(dtype=float))
+                else:
+                    strings = props[col].astype(str).to_numpy()
+                col_specs.append((strings, numeric_align if col in numeric_cols else None))
+            # Suspend repaints, sorting and signals from resizing the table
+            # through to the last inserted item
+            table.setUpdatesEnabled(False)
+            table.setSortingEnabled(False)
+            table.blockSignals(True)
             table.setRowCount(len(props))
             table.setColumnCount(len(columns))
             table.setHorizontalHeaderLabels(columns)
             header_font = QFont()
             header_font.setBold(True)
             table.horizontalHeader().setFont(header_font)
-            for i, row in props.iterrows():
-                for j, col in enumerate(columns):
-                    if col in ['Longitude', 'Latitude', 'Mapped Longitude', 'Mapped Latitude']:
-                        item = QTableWidgetItem(f"{row[col]:.15f}")
-                    else:
-                        item = QTableWidgetItem(str(row[col]))
-                    if isinstance(row[col], (int, float)):
-                        item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+            table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+            for j, (strings, align) in enumerate(col_specs):
+                for i, text in enumerate(strings):
+                    item = QTableWidgetItem(text)
+                    if align is not None:
+                        item.setTextAlignment(align)
                     table.setItem(i, j, item)
-            table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+            table.resizeColumnsToContents()
             table.horizontalHeader().setStretchLastSection(True)
-        splitter.addWidget(table)
-        splitter.setSizes([600, 400])
         progress.close()
         if scatter is not None and gdf is not None:
-            from matplotlib.offsetbox import AnnotationBbox, TextArea
             annot = ax.annotate("", xy=(0,0), xytext=(20,20), textcoords="offset points",
                             bbox={"boxstyle":"round,pad=0.5", "fc":"yellow", "alpha":0.8},
                             arrowprops={"arrowstyle":"->"}, fontsize=9)
             annot.set_visible(False)
+            # The annotation is blitted over a cached background so hovering
+            # never re-renders the raster, scatter and quiver layers.
+            annot.set_animated(True)
+            background = None
+            last_ind = None
+            pending_event = None
+            last_xy = None
+            # Tooltip columns as plain lists, so hovering indexes a value
+            # instead of boxing a whole DataFrame row per mouse move
+            tooltip_attrs = ['TN Bearing', 'Signal Strength', 'Date & Time']
+            tooltip_cols = {k: props[k].tolist() for k in tooltip_attrs if k in props.columns}
+            def on_draw(event):
+                nonlocal background
+                background = canvas.copy_from_bbox(fig.bbox)
+                if annot.get_visible():
+                    ax.draw_artist(annot)
+            def blit_annot():
+                if background is None:
+                    canvas.draw_idle()
+                    return
+                canvas.restore_region(background)
+                if annot.get_visible():
+                    ax.draw_artist(annot)
+                canvas.blit(fig.bbox)
             def on_pick(event):
                 ind = event.ind[0]
                 attr = props.iloc[ind].to_dict()
                 msg = '\n'.join(f"{k}: {v}" for k, v in attr.items())
-                scatter.set_facecolors(['red' if i != ind else 'yellow' for i in range(len(props))])
+                colors = base_colors.copy()
+                colors[ind] = (1.0, 1.0, 0.0, 1.0)
+                scatter.set_facecolors(colors)
                 canvas.draw()
                 table.selectRow(ind)
                 table.scrollToItem(table.item(ind, 0))
                 QMessageBox.information(self, 'Point Attributes', msg)
             def hover(event):
+                # Coalesce motion events: ignore sub-2px jitter and run the
+                # hit test at most once per ~60 Hz frame on the latest event
+                nonlocal pending_event, last_xy
+                if last_xy is not None and abs(event.x - last_xy[0]) < 2 and abs(event.y - last_xy[1]) < 2:
+                    return
+                last_xy = (event.x, event.y)
+                if pending_event is None:
+                    QTimer.singleShot(16, process_hover)
+                pending_event = event
+            def process_hover():
+                nonlocal pending_event, last_ind
+                event, pending_event = pending_event, None
+                if event is None or map_cids is not self._map_cids:
+                    # The map was reset or reloaded while the timer was pending
+                    return
                 if event.inaxes == ax:
                     cont, ind = scatter.contains(event)
                     if cont:
                         ind = ind['ind'][0]
-                        attr = props.iloc[ind].to_dict()
-                        tooltip_attrs = ['TN Bearing', 'Signal Strength', 'Date & Time']
-                        tooltip_text = '\n'.join(f"{k}: {attr.get(k, 'N/A')}" 
-                                               for k in tooltip_attrs if k in attr)
+                        if ind == last_ind:
+                            return
+                        last_ind = ind
+                        tooltip_text = '\n'.join(f"{k}: {v[ind]}" for k, v in tooltip_cols.items())
                         annot.xy = (points[ind][0], points[ind][1])
                         annot.set_text(tooltip_text)
                         annot.set_visible(True)
-                        fig.canvas.draw_idle()
+                        blit_annot()
                     else:
                         if annot.get_visible():
+                            last_ind = None
                             annot.set_visible(False)
-                            fig.canvas.draw_idle()
-            fig.canvas.mpl_connect('pick_event', on_pick)
-            fig.canvas.mpl_connect('motion_notify_event', hover)
+                            blit_annot()
+            map_cids = self._map_cids = [
+                canvas.mpl_connect('draw_event', on_draw),
+                canvas.mpl_connect('pick_event', on_pick),
+                canvas.mpl_connect('motion_notify_event', hover),
+            ]
+        canvas.draw_idle()
+
+    def reset_map_view(self):
+        """Empty the shared axes and table and drop the previous load's canvas handlers."""
+        for cid in self._map_cids:
+            self.canvas.mpl_disconnect(cid)
+        self._map_cids = []
+        self.ax.clear()
+        self.table.clear()
+        self.table.setRowCount(0)
+        self.table.setColumnCount(0)
 
     def clear_all(self):
-        for i in reversed(range(self.central_widget.layout().count())):
-            widget = self.central_widget.layout().itemAt(i).widget()
-            if widget:
-                widget.setParent(None)
+        self.reset_map_view()
+        self.toolbar.hide()
+        self.splitter.hide()
+        self.canvas.draw_idle()
         self.start_historical_tracking()
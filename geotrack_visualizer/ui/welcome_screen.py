@@ -1,7 +1,6 @@
-from PyQt5.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QTextBrowser, QPushButton, QFrame
-from PyQt5.QtCore import QSize
-from PyQt5.QtGui import QIcon
-from ..utils.helpers import resource_path
+from PyQt5.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QTextBrowser, QPushButton, QFrame, QCheckBox
+from PyQt5.QtCore import QSize, QFile, QTimer, QSettings
+from ..utils.helpers import resource_path, bundled_path, resource_url, app_icon
 
 class WelcomeScreen(QDialog):
     """
@@ -11,7 +10,7 @@ class WelcomeScreen(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Welcome to GeoTrack Visualizer")
-        self.setWindowIcon(QIcon(resource_path('icons/app_icon.png')))
+        self.setWindowIcon(app_icon())
         self.resize(800, 600)
         self.setup_ui()
         
@@ -19,70 +18,64 @@ class WelcomeScreen(QDialog):
         layout = QVBoxLayout(self)
         # Create markdown browser with custom styling
         self.text_browser = QTextBrowser()
+        self.text_browser.setObjectName("welcomeBrowser")
         self.text_browser.setOpenExternalLinks(True)
-        self.text_browser.setStyleSheet("""
-            QTextBrowser {
-                border: none;
-                background-color: #f8f9fa;
-                padding: 20px;
-                font-size: 14px;
-            }
-        """)
-        # Load HTML content directly
-        try:
-            self.text_browser.setSearchPaths([resource_path('')])
-            html_path = resource_path('welcome.html')
-            with open(html_path, 'r') as f:
-                html_content = f.read()
-                self.text_browser.setHtml(html_content)
-        except Exception as e:
-            self.text_browser.setPlainText(f"Error loading welcome content: {e}")
+        # Page content is loaded just after first show (see showEvent)
+        self._loaded = False
         # Create a styled start button
         button_container = QFrame()
         button_layout = QHBoxLayout(button_container)
         self.start_button = QPushButton("Start Application")
+        self.start_button.setObjectName("startButton")
         self.start_button.setMinimumSize(QSize(200, 50))
-        self.start_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                font-size: 16px;
-                font-weight: bold;
-                border-radius: 5px;
-                padding: 10px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-        """)
         self.start_button.clicked.connect(self.accept)
+        # Returning users can skip this screen on later launches (see main.py)
+        self.skip_checkbox = QCheckBox("Don't show this again")
+        button_layout.addWidget(self.skip_checkbox)
         button_layout.addStretch()
         button_layout.addWidget(self.start_button)
         button_layout.addStretch()
         layout.addWidget(self.text_browser)
         layout.addWidget(button_container)
+        self._dark_mode = False
+        # Styled by the application stylesheet (app.qss), keyed on object
+        # names and this property, so a theme switch is just a repolish
+        self.text_browser.setProperty("theme", "light")
+
+    def accept(self):
+        if self.skip_checkbox.isChecked():
+            QSettings('GeoTrack', 'Visualizer').setValue('skip_welcome', True)
+        super().accept()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._loaded:
+            self._loaded = True
+            # Let the dialog frame paint before the page is loaded and laid out
+            QTimer.singleShot(0, self._load_html)
+
+    def _load_html(self):
+        """Point the browser at welcome.html, or show an error if it can't be found."""
+        # Let the browser load the page itself rather than round-tripping it through Python
+        try:
+            self.text_browser.setSearchPaths([resource_path('')])
+            html_path = bundled_path('welcome.html')
+            if not QFile.exists(html_path):
+                raise FileNotFoundError(html_path)
+            self.text_browser.setSource(resource_url('welcome.html'))
+            if self.text_browser.document().isEmpty():
+                # setSource fails silently; fall back to reading the file ourselves
+                with open(resource_path('welcome.html'), 'r') as f:
+                    self.text_browser.setHtml(f.read())
+        except Exception as e:
+            self.text_browser.setPlainText(f"Error loading welcome content: {e}")
+
     def update_theme(self, dark_mode):
         """Update the welcome screen appearance based on dark/light mode"""
-        if dark_mode:
-            self.text_browser.setStyleSheet("""
-                QTextBrowser {
-                    border: none;
-                    background-color: #2d2d2d;
-                    color: #ffffff;
-                    padding: 20px;
-                    font-size: 14px;
-                }
-            """)
-        else:
-            self.text_browser.setStyleSheet("""
-                QTextBrowser {
-                    border: none;
-                    background-color: #f8f9fa;
-                    color: #000000;
-                    padding: 20px;
-                    font-size: 14px;
-                }
-            """)
+        if dark_mode == self._dark_mode:
+            return
+        self._dark_mode = dark_mode
+        self.text_browser.setProperty("theme", "dark" if dark_mode else "light")
+        style = self.text_browser.style()
+        style.unpolish(self.text_browser)
+        style.polish(self.text_browser)
@@ -1,15 +1,63 @@
 import sys
 import os
+import functools
+from PyQt5.QtCore import QUrl, QFile
+from PyQt5.QtGui import QIcon
+
+# Compiled Qt resources (welcome page and its icons, stylesheet, app icon), generated with:
+#   pyrcc5 resources.qrc -o geotrack_visualizer/utils/resources_rc.py
+# Importing the module registers the data under ':/'; without it the files are
+# read from disk as before.
+try:
+    from . import resources_rc
+except ImportError:
+    resources_rc = None
+
+# Base directory for bundled resources, resolved once at import time
+try:
+    # PyInstaller creates a temp folder and stores path in _MEIPASS
+    _BASE_PATH = sys._MEIPASS
+except AttributeError:
+    _BASE_PATH = os.path.abspath(os.path.dirname(__file__))
+
+# Project-level icons directory; resolves to icons/ under _MEIPASS when frozen
+_ICONS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'icons'))
 
 # Helper function to handle paths in both script and executable modes
+@functools.lru_cache(maxsize=None)
 def resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller"""
+    return os.path.join(_BASE_PATH, relative_path)
+
+def bundled_path(relative_path):
+    """Get a path Qt can open for a read-only resource, preferring the compiled bundle"""
+    if resources_rc is not None:
+        return f":/{relative_path}"
+    return resource_path(relative_path)
+
+def resource_url(relative_path):
+    """Get a QUrl for a read-only resource, preferring the compiled bundle"""
+    if resources_rc is not None:
+        return QUrl(f"qrc:/{relative_path}")
+    return QUrl.fromLocalFile(resource_path(relative_path))
+
+@functools.lru_cache(maxsize=None)
+def app_icon():
+    """Get the application icon, decoded once and shared by every window"""
+    if resources_rc is not None:
+        return QIcon(':/icons/app_icon.png')
+    return QIcon(os.path.join(_ICONS_DIR, 'app_icon.png'))
+
+@functools.lru_cache(maxsize=None)
+def app_stylesheet():
+    """Get the application-wide stylesheet (app.qss), read once; empty if missing"""
+    qss_file = QFile(bundled_path('app.qss'))
+    if not qss_file.open(QFile.ReadOnly | QFile.Text):
+        return ''
     try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(os.path.dirname(__file__))
-    return os.path.join(base_path, relative_path)
+        return bytes(qss_file.readAll()).decode('utf-8')
+    finally:
+        qss_file.close()
 
 # Configuration paths
 CONFIG_PATH = resource_path(os.path.join('settings', 'config.json'))
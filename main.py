@@ -8,24 +8,44 @@ with features for interactive exploration, map styling, and data analysis.
 """
 
 import sys
-from PyQt5.QtWidgets import QApplication, QDialog
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import QSettings
 from geotrack_visualizer.ui.welcome_screen import WelcomeScreen
-from geotrack_visualizer.ui.main_window import MainWindow
+from geotrack_visualizer.utils.helpers import app_stylesheet
+
+def show_main_window(windows):
+    """Create the main window and keep a reference to it for the app's lifetime."""
+    # Imported here so matplotlib's Qt backend isn't loaded before the welcome
+    # screen paints.
+    from geotrack_visualizer.ui.main_window import MainWindow
+    window = MainWindow()
+    window.show()
+    windows.append(window)
+    # The main window is up, so closing it ends the app again
+    QApplication.instance().setQuitOnLastWindowClosed(True)
 
 if __name__ == "__main__":
     # Create and run the application
     app = QApplication(sys.argv)
-    # Show welcome screen first
-    welcome = WelcomeScreen()
-    result = welcome.exec_()
-    if result == QDialog.Accepted:
-        # If user clicked Start, show the main application
-        window = MainWindow()
-        window.show()
-        sys.exit(app.exec_())
+    # Parse the shared stylesheet once for every window and dialog
+    app.setStyleSheet(app_stylesheet())
+    windows = []
+    # Show welcome screen first, unless the user opted out of it. Everything
+    # runs in the single app.exec_() loop below.
+    if QSettings('GeoTrack', 'Visualizer').value('skip_welcome', False, type=bool):
+        show_main_window(windows)
     else:
+        # Accepting hides the welcome screen before the main window exists, and
+        # MainWindow may first open a (native) directory picker; don't let Qt
+        # treat that gap as the last window closing. Rejecting quits explicitly.
+        app.setQuitOnLastWindowClosed(False)
+        welcome = WelcomeScreen()
+        # If user clicked Start, show the main application
+        welcome.accepted.connect(lambda: show_main_window(windows))
         # If welcome screen was closed, exit the application
-        sys.exit(0)
+        welcome.rejected.connect(app.quit)
+        welcome.show()
+    sys.exit(app.exec_())
 
 class CustomNavigationToolbar(NavigationToolbar2QT):
     """